@@ -1,172 +1,9 @@
 import streamlit as st
-from dataclasses import dataclass, field
-from typing import Dict, Literal, List, Union, Any
-from enum import Enum
-import uuid
-
-# --- DATA STRUCTURES (NEW) ---
-class PaintSurface(Enum):
-    WALLS_STANDARD = 'walls_standard'
-    WALLS_DURABLE = 'walls_durable'
-    CEILING = 'ceiling'
-    WOODWORK = 'woodwork'
-    DOOR_FRAME = 'door_frame'
-    WINDOW_FRAME = 'window_frame'
-    RADIATOR = 'radiator'
-    OTHER = 'other'
-
-@dataclass
-class MaterialRate:
-  surfaceType: PaintSurface
-  coveragePerLitre: float
-  costPerLitre: float
-
-@dataclass
-class LabourRate:
-  task: str # User-friendly description of the task
-  unit: Literal['sqm', 'm', 'item', 'hour']
-  hoursPerUnitPerCoat: float
-
-@dataclass
-class PresetConfig:
-  materialRates: Dict[PaintSurface, MaterialRate]
-  labourRates: Dict[str, LabourRate] # Keyed by a unique string identifier e.g., 'paint_walls_std_eff'
-  miscCosts: Dict[str, float]
-  markupPercent: float
-  vatApplicable: bool
-  materialContingencyPercent: float
-  labourContingencyPercent: float
-  defaultTeamSize: int
-  hourlyChargeRate: float
-
-@dataclass
-class RoomInput:
-  id: str = field(default_factory=lambda: str(uuid.uuid4()))
-  name: str = "New Room"
-  wallArea: float = 0.0
-  ceilingArea: float = 0.0
-  woodworkLength: float = 0.0
-  doorCount: int = 0
-  windowCount: int = 0
-  coatsWalls: int = 2
-  coatsCeiling: int = 1
-  coatsWoodwork: int = 1
-  coatsDoors: int = 2
-  coatsWindows: int = 2
-  paintChoiceWalls: PaintSurface = PaintSurface.WALLS_STANDARD
-  paintChoiceCeiling: PaintSurface = PaintSurface.CEILING
-  paintChoiceWoodwork: PaintSurface = PaintSurface.WOODWORK
-  heavyPrep: bool = False
-  wallpaperArea: float = 0.0
-  removeWallpaperArea: float = 0.0
-  notes: str = ""
-
-# --- CORE CALCULATION FUNCTIONS ---
-def litres_needed(area_or_length: float, coats: int, coverage_per_litre: float) -> float:
-    if coverage_per_litre == 0: return 0.0
-    return (area_or_length * coats) / coverage_per_litre
-
-def material_cost_for_doors_windows(count: int, coats: int, cost_per_item_per_coat: float) -> float:
-    return float(count * coats * cost_per_item_per_coat)
-
-def quote_room(room: RoomInput, cfg: PresetConfig) -> Dict[str, Any]:
-    m_rates = cfg.materialRates; l_rates = cfg.labourRates; misc_costs = cfg.miscCosts
-    wall_paint_cost = 0.0
-    if room.wallArea > 0 and room.coatsWalls > 0 and room.paintChoiceWalls in m_rates:
-        wall_material_rate = m_rates[room.paintChoiceWalls]
-        wall_paint_cost = litres_needed(room.wallArea, room.coatsWalls, wall_material_rate.coveragePerLitre) * wall_material_rate.costPerLitre
-    ceiling_paint_cost = 0.0
-    if room.ceilingArea > 0 and room.coatsCeiling > 0 and room.paintChoiceCeiling in m_rates:
-        ceiling_material_rate = m_rates[room.paintChoiceCeiling]
-        ceiling_paint_cost = litres_needed(room.ceilingArea, room.coatsCeiling, ceiling_material_rate.coveragePerLitre) * ceiling_material_rate.costPerLitre
-    wood_paint_cost = 0.0
-    if room.woodworkLength > 0 and room.coatsWoodwork > 0 and room.paintChoiceWoodwork in m_rates:
-        wood_material_rate = m_rates[room.paintChoiceWoodwork]
-        wood_paint_cost = litres_needed(room.woodworkLength, room.coatsWoodwork, wood_material_rate.coveragePerLitre) * wood_material_rate.costPerLitre
-    door_mat_cost = 0.0
-    if room.doorCount > 0 and room.coatsDoors > 0:
-        door_mat_cost = material_cost_for_doors_windows(room.doorCount, room.coatsDoors, misc_costs.get('door_material_cost_per_item_per_coat', 0.0))
-    window_mat_cost = 0.0
-    if room.windowCount > 0 and room.coatsWindows > 0:
-        window_mat_cost = material_cost_for_doors_windows(room.windowCount, room.coatsWindows, misc_costs.get('window_material_cost_per_item_per_coat', 0.0))
-    prep_material_rate_key = 'prep_materials_cost_per_sqm_heavy' if room.heavyPrep else 'prep_materials_cost_per_sqm_general'
-    prep_mat_cost = (room.wallArea + room.ceilingArea) * misc_costs.get(prep_material_rate_key, 0.0)
-    base_materials_cost = wall_paint_cost + ceiling_paint_cost + wood_paint_cost + door_mat_cost + window_mat_cost + misc_costs.get('sundries_per_room_fixed', 0.0) + prep_mat_cost
-    buffered_materials_cost = base_materials_cost * (1 + cfg.materialContingencyPercent / 100)
-    hours = 0.0
-    if room.wallArea > 0 and room.coatsWalls > 0 and 'paint_walls' in l_rates: hours += room.wallArea * room.coatsWalls * l_rates['paint_walls'].hoursPerUnitPerCoat
-    if room.ceilingArea > 0 and room.coatsCeiling > 0 and 'paint_ceiling' in l_rates: hours += room.ceilingArea * room.coatsCeiling * l_rates['paint_ceiling'].hoursPerUnitPerCoat
-    if room.woodworkLength > 0 and room.coatsWoodwork > 0 and 'paint_woodwork' in l_rates: hours += room.woodworkLength * room.coatsWoodwork * l_rates['paint_woodwork'].hoursPerUnitPerCoat
-    if room.doorCount > 0 and room.coatsDoors > 0 and 'paint_door_item' in l_rates: hours += room.doorCount * room.coatsDoors * l_rates['paint_door_item'].hoursPerUnitPerCoat
-    if room.windowCount > 0 and room.coatsWindows > 0 and 'paint_window_item' in l_rates: hours += room.windowCount * room.coatsWindows * l_rates['paint_window_item'].hoursPerUnitPerCoat
-    if room.removeWallpaperArea > 0 and 'wallpaper_removal_sqm' in l_rates: hours += room.removeWallpaperArea * l_rates['wallpaper_removal_sqm'].hoursPerUnitPerCoat
-    prep_labour_rate_key = 'prep_sqm_heavy' if room.heavyPrep else 'prep_sqm_general'
-    if (room.wallArea + room.ceilingArea > 0) and prep_labour_rate_key in l_rates: hours += (room.wallArea + room.ceilingArea) * l_rates[prep_labour_rate_key].hoursPerUnitPerCoat
-    buffered_hours = hours * (1 + cfg.labourContingencyPercent / 100)
-    total_labour_cost = buffered_hours * cfg.hourlyChargeRate
-    return {"roomId": room.id, "roomName": room.name, "materialsCost": round(buffered_materials_cost, 2), "labourCost": round(total_labour_cost, 2), "totalCost": round(buffered_materials_cost + total_labour_cost, 2)}
-
-def quote_job(rooms: List[RoomInput], cfg: PresetConfig, add_ons: Dict[str, float] = None) -> Dict[str, Any]:
-    if add_ons is None: add_ons = {}
-    room_breakdowns = [quote_room(r, cfg) for r in rooms]
-    total_materials_cost = sum(r['materialsCost'] for r in room_breakdowns)
-    total_labour_cost = sum(r['labourCost'] for r in room_breakdowns)
-    total_add_ons_cost = sum(float(v) for v in add_ons.values() if isinstance(v, (int, float)))
-    sub_total_before_markup = total_materials_cost + total_labour_cost + total_add_ons_cost
-    markup_amount = sub_total_before_markup * (cfg.markupPercent / 100)
-    total_before_vat = sub_total_before_markup + markup_amount
-    vat_amount = 0.0; VAT_RATE = 0.20
-    if cfg.vatApplicable: vat_amount = total_before_vat * VAT_RATE
-    grand_total = total_before_vat + vat_amount
-    return {
-        "roomBreakdowns": room_breakdowns,
-        "totalMaterialsCost": round(total_materials_cost, 2),
-        "totalLabourCost": round(total_labour_cost, 2),
-        "totalAddOnsCost": round(total_add_ons_cost, 2),
-        "subTotalBeforeMarkup": round(sub_total_before_markup, 2),
-        "markupAmount": round(markup_amount, 2),
-        "totalBeforeVAT": round(total_before_vat, 2),
-        "vatAmount": round(vat_amount, 2),
-        "grandTotal": round(grand_total, 2)
-    }
-
-# --- DEFAULT PRESET CONFIGURATION ---
-DEFAULT_PRESET_CONFIG = PresetConfig(
-    materialRates={
-        PaintSurface.WALLS_STANDARD: MaterialRate(surfaceType=PaintSurface.WALLS_STANDARD, coveragePerLitre=12.0, costPerLitre=1.80),
-        PaintSurface.WALLS_DURABLE: MaterialRate(surfaceType=PaintSurface.WALLS_DURABLE, coveragePerLitre=10.0, costPerLitre=2.75),
-        PaintSurface.CEILING: MaterialRate(surfaceType=PaintSurface.CEILING, coveragePerLitre=14.0, costPerLitre=1.50),
-        PaintSurface.WOODWORK: MaterialRate(surfaceType=PaintSurface.WOODWORK, coveragePerLitre=10.0, costPerLitre=3.50),
-        PaintSurface.DOOR_FRAME: MaterialRate(surfaceType=PaintSurface.DOOR_FRAME, coveragePerLitre=10.0, costPerLitre=3.25),
-        PaintSurface.WINDOW_FRAME: MaterialRate(surfaceType=PaintSurface.WINDOW_FRAME, coveragePerLitre=10.0, costPerLitre=3.25),
-        PaintSurface.RADIATOR: MaterialRate(surfaceType=PaintSurface.RADIATOR, coveragePerLitre=8.0, costPerLitre=4.50),
-        PaintSurface.OTHER: MaterialRate(surfaceType=PaintSurface.OTHER, coveragePerLitre=10.0, costPerLitre=2.00),
-    },
-    labourRates={
-        'paint_walls': LabourRate(task='Paint Walls', unit='sqm', hoursPerUnitPerCoat=0.12),
-        'paint_ceiling': LabourRate(task='Paint Ceiling', unit='sqm', hoursPerUnitPerCoat=0.15),
-        'paint_woodwork': LabourRate(task='Paint Woodwork (skirting, etc.)', unit='m', hoursPerUnitPerCoat=0.20),
-        'paint_door_item': LabourRate(task='Paint Door (per item, both sides)', unit='item', hoursPerUnitPerCoat=1.5),
-        'paint_window_item': LabourRate(task='Paint Window (per item)', unit='item', hoursPerUnitPerCoat=1.25),
-        'prep_sqm_general': LabourRate(task='General Prep (walls/ceiling)', unit='sqm', hoursPerUnitPerCoat=0.05),
-        'prep_sqm_heavy': LabourRate(task='Heavy Prep (walls/ceiling)', unit='sqm', hoursPerUnitPerCoat=0.20),
-        'wallpaper_removal_sqm': LabourRate(task='Wallpaper Removal', unit='sqm', hoursPerUnitPerCoat=0.33),
-    },
-    miscCosts={
-        'sundries_per_room_fixed': 15.00,
-        'door_material_cost_per_item_per_coat': 5.00,
-        'window_material_cost_per_item_per_coat': 3.50,
-        'prep_materials_cost_per_sqm_general': 0.50,
-        'prep_materials_cost_per_sqm_heavy': 1.75,
-        'waste_disposal_fixed': 25.00,
-    },
-    markupPercent=25.0,
-    vatApplicable=True,
-    materialContingencyPercent=10.0,
-    labourContingencyPercent=10.0,
-    defaultTeamSize=2,
-    hourlyChargeRate=45.0
-)
+from typing import List
+import io
+
+from quoting import PaintSurface, PresetConfig, RoomInput, quote_job, DEFAULT_PRESET_CONFIG, VAT_RATE
+from quote_export import write_quote_csv, write_quote_html
 
 # --- SESSION STATE ---
 if "rooms" not in st.session_state:
@@ -204,6 +41,15 @@ def format_task_key_option(option_value: str) -> str:
         return st.session_state.current_preset.labourRates[option_value].task
     return option_value.replace('_', ' ').title()
 
+def export_to_bytes(writer, job_quote: dict, cfg: PresetConfig) -> io.BytesIO:
+    # st.download_button needs the whole file, so the UI path buffers it once; the exporters themselves stream.
+    buffer = io.BytesIO()
+    text_stream = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+    writer(job_quote, cfg, text_stream)
+    text_stream.flush(); text_stream.detach()
+    buffer.seek(0)
+    return buffer
+
 # Section for Adding Rooms
 st.header("1. Add Room Details")
 st.caption("Fill in the details for each room you want to include in the quote.")
@@ -356,9 +202,21 @@ else:
         with summary_col3:
             st.markdown(f"**Total Before VAT: £{job_quote_details['totalBeforeVAT']:.2f}**")
             if st.session_state.current_preset.vatApplicable:
-                st.markdown(f"VAT (20%): £{job_quote_details['vatAmount']:.2f}")
+                st.markdown(f"VAT ({VAT_RATE * 100:g}%): £{job_quote_details['vatAmount']:.2f}")
             st.markdown(f"### Grand Total: £{job_quote_details['grandTotal']:.2f}")
 
+        st.subheader("C. Export")
+        st.caption("Export files are only generated when requested, not on every page refresh.")
+        export_col1, export_col2 = st.columns(2)
+        with export_col1:
+            if st.button("Prepare Room Schedule (CSV)", key="prepare_export_csv"):
+                csv_bytes = export_to_bytes(write_quote_csv, job_quote_details, st.session_state.current_preset)
+                st.download_button("⬇️ Download Room Schedule (CSV)", data=csv_bytes, file_name="quote.csv", mime="text/csv", key="export_csv")
+        with export_col2:
+            if st.button("Prepare Printable Quote (HTML/PDF)", key="prepare_export_html"):
+                html_bytes = export_to_bytes(write_quote_html, job_quote_details, st.session_state.current_preset)
+                st.download_button("⬇️ Download Printable Quote (HTML/PDF)", data=html_bytes, file_name="quote.html", mime="text/html", key="export_html", help="Paginated for printing; use your browser's Print to PDF.")
+
     else:
         st.error("Critical Error: No preset configuration loaded. Cannot calculate quote.")
 
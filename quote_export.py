@@ -0,0 +1,94 @@
+from typing import Dict, List, Union, Any, Iterable, Iterator, TextIO
+import csv
+import html
+
+from quoting import PresetConfig, RoomInput, quote_room, job_totals, VAT_RATE
+
+# --- EXPORT FUNCTIONS ---
+# Exporters consume room breakdowns one at a time and write straight to `out`, so memory
+# stays bounded by a single page however many rooms the job has. Pass either quote_job
+# output or a lazy stream such as iter_room_quotes(rooms, cfg).
+def iter_room_quotes(rooms: Iterable[RoomInput], cfg: PresetConfig) -> Iterator[Dict[str, Any]]:
+    for room in rooms:
+        yield quote_room(room, cfg)
+
+def _room_breakdowns_from(source: Union[Dict[str, Any], Iterable[Dict[str, Any]]], add_ons: Dict[str, float] = None) -> Iterable[Dict[str, Any]]:
+    if isinstance(source, dict):
+        # quote_job output already carries its add-ons and totals; a second add_ons would contradict them.
+        if add_ons is not None: raise ValueError("add_ons cannot be combined with quote_job output; pass them to quote_job instead")
+        return source.get("roomBreakdowns", [])
+    return source
+
+def _totals_for(source: Union[Dict[str, Any], Iterable[Dict[str, Any]]], total_materials_cost: float, total_labour_cost: float, cfg: PresetConfig, add_ons: Dict[str, float] = None) -> Dict[str, Any]:
+    if isinstance(source, dict): return {k: v for k, v in source.items() if k != "roomBreakdowns"}
+    return job_totals(total_materials_cost, total_labour_cost, cfg, add_ons)
+
+def _summary_lines(totals: Dict[str, Any], cfg: PresetConfig) -> List[tuple]:
+    lines = [("Total Materials Cost", totals['totalMaterialsCost']), ("Total Labour Cost", totals['totalLabourCost'])]
+    if totals['totalAddOnsCost'] > 0: lines.append(("Add-Ons Total", totals['totalAddOnsCost']))
+    lines.append(("Sub-Total (Before Markup)", totals['subTotalBeforeMarkup']))
+    lines.append((f"Markup ({cfg.markupPercent}%)", totals['markupAmount']))
+    lines.append(("Total Before VAT", totals['totalBeforeVAT']))
+    if cfg.vatApplicable: lines.append((f"VAT ({VAT_RATE * 100:g}%)", totals['vatAmount']))
+    lines.append(("Grand Total", totals['grandTotal']))
+    return lines
+
+_CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+def _csv_safe_text(value: Any) -> str:
+    # Stop spreadsheets from evaluating user-entered text such as room names as formulas.
+    text = str(value)
+    if text.startswith(_CSV_FORMULA_PREFIXES): return "'" + text
+    return text
+
+def write_quote_csv(source: Union[Dict[str, Any], Iterable[Dict[str, Any]]], cfg: PresetConfig, out: TextIO, add_ons: Dict[str, float] = None) -> Dict[str, Any]:
+    writer = csv.writer(out)
+    room_breakdowns = _room_breakdowns_from(source, add_ons)
+    writer.writerow(["Room", "Materials Cost", "Labour Cost", "Total Cost"])
+    total_materials_cost = 0.0; total_labour_cost = 0.0
+    for room_quote in room_breakdowns:
+        writer.writerow([_csv_safe_text(room_quote['roomName']), f"{room_quote['materialsCost']:.2f}", f"{room_quote['labourCost']:.2f}", f"{room_quote['totalCost']:.2f}"])
+        total_materials_cost += room_quote['materialsCost']; total_labour_cost += room_quote['labourCost']
+    totals = _totals_for(source, total_materials_cost, total_labour_cost, cfg, add_ons)
+    writer.writerow([])
+    for label, amount in _summary_lines(totals, cfg):
+        writer.writerow([_csv_safe_text(label), "", "", f"{amount:.2f}"])
+    return totals
+
+_HTML_TABLE_HEAD = "<table><thead><tr><th>Room</th><th>Materials</th><th>Labour</th><th>Total</th></tr></thead><tbody>\n"
+
+def _html_page_footer(page_number: int, page_materials: float, page_labour: float, page_total: float) -> str:
+    return (f"</tbody><tfoot><tr><th>Page {page_number} subtotal</th><th>£{page_materials:.2f}</th>"
+            f"<th>£{page_labour:.2f}</th><th>£{page_total:.2f}</th></tr></tfoot></table>\n")
+
+def write_quote_html(source: Union[Dict[str, Any], Iterable[Dict[str, Any]]], cfg: PresetConfig, out: TextIO, add_ons: Dict[str, float] = None, rows_per_page: int = 40, title: str = "Quote") -> Dict[str, Any]:
+    # Paginated print layout: each page is its own table with a page subtotal and a CSS page
+    # break, so "Print to PDF" in a browser yields the paginated PDF schedule.
+    if rows_per_page < 1: raise ValueError("rows_per_page must be at least 1")
+    room_breakdowns = _room_breakdowns_from(source, add_ons)
+    out.write(f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title>\n"
+              "<style>body{font-family:sans-serif}table{width:100%;border-collapse:collapse;margin-bottom:1em}"
+              "th,td{border:1px solid #ccc;padding:4px;text-align:right}th:first-child,td:first-child{text-align:left}"
+              ".page{page-break-after:always;break-after:page}</style></head><body>\n"
+              f"<h1>{html.escape(title)}</h1>\n")
+    total_materials_cost = 0.0; total_labour_cost = 0.0
+    page_number = 0; page_rows = 0; page_materials = 0.0; page_labour = 0.0; page_total = 0.0
+    for room_quote in room_breakdowns:
+        if page_rows == 0:
+            page_number += 1
+            out.write(f"<div class=\"page\"><h2>Room Schedule - Page {page_number}</h2>\n" + _HTML_TABLE_HEAD)
+        out.write(f"<tr><td>{html.escape(str(room_quote['roomName']))}</td><td>£{room_quote['materialsCost']:.2f}</td>"
+                  f"<td>£{room_quote['labourCost']:.2f}</td><td>£{room_quote['totalCost']:.2f}</td></tr>\n")
+        page_rows += 1; page_materials += room_quote['materialsCost']; page_labour += room_quote['labourCost']; page_total += room_quote['totalCost']
+        total_materials_cost += room_quote['materialsCost']; total_labour_cost += room_quote['labourCost']
+        if page_rows == rows_per_page:
+            out.write(_html_page_footer(page_number, page_materials, page_labour, page_total) + "</div>\n")
+            page_rows = 0; page_materials = 0.0; page_labour = 0.0; page_total = 0.0
+    if page_rows > 0:
+        out.write(_html_page_footer(page_number, page_materials, page_labour, page_total) + "</div>\n")
+    totals = _totals_for(source, total_materials_cost, total_labour_cost, cfg, add_ons)
+    out.write("<h2>Job Summary</h2>\n<table><tbody>\n")
+    for label, amount in _summary_lines(totals, cfg):
+        out.write(f"<tr><th>{html.escape(label)}</th><td>£{amount:.2f}</td></tr>\n")
+    out.write("</tbody></table>\n</body></html>\n")
+    return totals
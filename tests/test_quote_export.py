@@ -0,0 +1,136 @@
+import csv
+import io
+import tracemalloc
+
+import pytest
+
+from quoting import RoomInput, quote_job, DEFAULT_PRESET_CONFIG
+from quote_export import iter_room_quotes, write_quote_csv, write_quote_html
+
+
+def make_rooms(count):
+    return [RoomInput(name=f"Room {i}", wallArea=30.0, ceilingArea=12.0, woodworkLength=14.0, doorCount=1, windowCount=1) for i in range(count)]
+
+def totals_of(job):
+    return {k: v for k, v in job.items() if k != "roomBreakdowns"}
+
+class CountingStream:
+    def __init__(self, items):
+        self.items = items
+        self.iterations = 0
+    def __iter__(self):
+        self.iterations += 1
+        return iter(self.items)
+
+
+@pytest.mark.parametrize("writer", [write_quote_csv, write_quote_html])
+def test_stream_totals_match_quote_job(writer):
+    rooms = make_rooms(7)
+    totals = writer(iter_room_quotes(rooms, DEFAULT_PRESET_CONFIG), DEFAULT_PRESET_CONFIG, io.StringIO())
+    assert totals == totals_of(quote_job(rooms, DEFAULT_PRESET_CONFIG))
+
+@pytest.mark.parametrize("writer", [write_quote_csv, write_quote_html])
+def test_generator_source_is_consumed_once(writer):
+    source = CountingStream(list(iter_room_quotes(make_rooms(3), DEFAULT_PRESET_CONFIG)))
+    writer(source, DEFAULT_PRESET_CONFIG, io.StringIO())
+    assert source.iterations == 1
+
+def test_csv_has_one_row_per_room_then_summary():
+    rooms = make_rooms(4)
+    out = io.StringIO()
+    write_quote_csv(quote_job(rooms, DEFAULT_PRESET_CONFIG), DEFAULT_PRESET_CONFIG, out)
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == ["Room", "Materials Cost", "Labour Cost", "Total Cost"]
+    assert [r[0] for r in rows[1:5]] == [room.name for room in rooms]
+    assert rows[5] == []
+    assert rows[-1][0] == "Grand Total"
+
+@pytest.mark.parametrize("room_count, expected_pages", [(0, 0), (1, 1), (5, 1), (6, 2), (11, 3)])
+def test_html_pagination_boundaries(room_count, expected_pages):
+    out = io.StringIO()
+    write_quote_html(iter_room_quotes(make_rooms(room_count), DEFAULT_PRESET_CONFIG), DEFAULT_PRESET_CONFIG, out, rows_per_page=5)
+    document = out.getvalue()
+    assert document.count('<div class="page">') == expected_pages
+    assert document.count("subtotal</th>") == expected_pages
+    assert "Grand Total" in document
+    assert document.rstrip().endswith("</html>")
+
+def test_html_escapes_room_names():
+    rooms = [RoomInput(name="<script>alert(1)</script>", wallArea=10.0)]
+    out = io.StringIO()
+    write_quote_html(iter_room_quotes(rooms, DEFAULT_PRESET_CONFIG), DEFAULT_PRESET_CONFIG, out)
+    assert "<script>" not in out.getvalue()
+    assert "&lt;script&gt;" in out.getvalue()
+
+def test_html_rejects_non_positive_page_size():
+    with pytest.raises(ValueError):
+        write_quote_html([], DEFAULT_PRESET_CONFIG, io.StringIO(), rows_per_page=0)
+
+def test_html_writes_incrementally():
+    # Each row must reach the output before the next room is pulled from the source.
+    out = io.StringIO()
+    seen_lengths = []
+    def source():
+        for room_quote in iter_room_quotes(make_rooms(4), DEFAULT_PRESET_CONFIG):
+            seen_lengths.append(len(out.getvalue()))
+            yield room_quote
+    write_quote_html(source(), DEFAULT_PRESET_CONFIG, out, rows_per_page=2)
+    assert seen_lengths == sorted(set(seen_lengths))
+
+@pytest.mark.parametrize("writer", [write_quote_csv, write_quote_html])
+def test_peak_memory_does_not_grow_with_job_size(writer):
+    class NullWriter:
+        def write(self, text):
+            return len(text)
+    def peak_for(room_count):
+        rooms = (RoomInput(name="Room", wallArea=10.0) for _ in range(room_count))
+        tracemalloc.start()
+        writer(iter_room_quotes(rooms, DEFAULT_PRESET_CONFIG), DEFAULT_PRESET_CONFIG, NullWriter())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+    assert peak_for(5000) < peak_for(100) * 2
+
+@pytest.mark.parametrize("writer", [write_quote_csv, write_quote_html])
+def test_quote_job_source_keeps_its_add_ons_and_totals(writer):
+    job = quote_job(make_rooms(2), DEFAULT_PRESET_CONFIG, {"scaffold": 100.0})
+    out = io.StringIO()
+    totals = writer(job, DEFAULT_PRESET_CONFIG, out)
+    assert totals == totals_of(job)
+    assert "Add-Ons Total" in out.getvalue()
+    assert f"{job['grandTotal']:.2f}" in out.getvalue()
+
+@pytest.mark.parametrize("writer", [write_quote_csv, write_quote_html])
+def test_stream_source_applies_add_ons(writer):
+    rooms = make_rooms(2)
+    totals = writer(iter_room_quotes(rooms, DEFAULT_PRESET_CONFIG), DEFAULT_PRESET_CONFIG, io.StringIO(), add_ons={"scaffold": 100.0})
+    assert totals == totals_of(quote_job(rooms, DEFAULT_PRESET_CONFIG, {"scaffold": 100.0}))
+
+@pytest.mark.parametrize("writer", [write_quote_csv, write_quote_html])
+def test_quote_job_source_rejects_separate_add_ons(writer):
+    job = quote_job(make_rooms(1), DEFAULT_PRESET_CONFIG)
+    out = io.StringIO()
+    with pytest.raises(ValueError):
+        writer(job, DEFAULT_PRESET_CONFIG, out, add_ons={"scaffold": 100.0})
+    assert out.getvalue() == ""
+
+def test_html_page_subtotal_sums_the_printed_row_totals():
+    # quote_room rounds each column separately, so materials + labour can differ from totalCost by a penny.
+    room_quote = {"roomName": "Hall", "materialsCost": 16.59, "labourCost": 1.44, "totalCost": 18.02}
+    out = io.StringIO()
+    write_quote_html([room_quote], DEFAULT_PRESET_CONFIG, out)
+    assert "subtotal</th><th>£16.59</th><th>£1.44</th><th>£18.02</th>" in out.getvalue()
+
+@pytest.mark.parametrize("name", ['=HYPERLINK("x")', "+1", "-1", "@SUM(A1)", "\t=1"])
+def test_csv_neutralises_formula_room_names(name):
+    out = io.StringIO()
+    write_quote_csv(iter_room_quotes([RoomInput(name=name, wallArea=10.0)], DEFAULT_PRESET_CONFIG), DEFAULT_PRESET_CONFIG, out)
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[1][0] == "'" + name
+
+def test_vat_label_follows_vat_rate(monkeypatch):
+    import quote_export
+    monkeypatch.setattr(quote_export, "VAT_RATE", 0.175)
+    out = io.StringIO()
+    write_quote_csv(quote_job(make_rooms(1), DEFAULT_PRESET_CONFIG), DEFAULT_PRESET_CONFIG, out)
+    assert "VAT (17.5%)" in out.getvalue()